@@ -2,9 +2,10 @@ import discord
 from discord.ext import commands
 import wavelink
 import json
-import datetime
 import asyncio
+import collections
 import random
+import time
 
 # Load config
 with open("config.json") as f:
@@ -31,47 +32,147 @@ async def on_message(message: discord.Message):
         return # Ignore messages from other bots
 
 
+# Lavalink searches are an HTTP round-trip per /play, so identical queries
+# within a short window reuse the previous result instead of hitting the node
+# again. Entries expire after SEARCH_CACHE_TTL seconds to avoid staleness.
+SEARCH_CACHE_TTL = 300
+SEARCH_CACHE_MAX = 128
+_search_cache = {}
+
+
+async def cached_search(query: str):
+    now = time.monotonic()
+    hit = _search_cache.get(query)
+    if hit and now - hit[0] < SEARCH_CACHE_TTL:
+        return hit[1]
+
+    tracks = await wavelink.Playable.search(query)
+    _search_cache[query] = (now, tracks)
+    if len(_search_cache) > SEARCH_CACHE_MAX:
+        # Dicts keep insertion order, so the first key is the oldest entry
+        _search_cache.pop(next(iter(_search_cache)))
+    return tracks
+
+
+# Static pieces of the "Now Playing" embed; only the dynamic values are
+# formatted per track.
+NP_TITLE = "<a:musicaaa:1374994485066469386> Now Playing"
+NP_COLOR = discord.Color.blue()
+NP_DURATION_NAME = "<a:durdation:1374998011020840980> Duration"
+NP_REQUESTED_BY_NAME = "<:dsdmember:1374997619935281283> Requested by"
+NP_REQUESTED_AT_NAME = "<a:welcomeada:1374997616844341359> Requested at"
+
+# Filled in once on_ready fires; avoids walking bot.user on every embed build
+_bot_name_cache = {"name": None}
+
+
+# strftime is surprisingly costly for how often the "Requested at" field is
+# rendered; re-format only when the wall-clock second actually changes.
+_last_hms = [-1, ""]
+
+
+def _now_hms() -> str:
+    now = int(time.time())
+    if _last_hms[0] != now:
+        _last_hms[0] = now
+        _last_hms[1] = time.strftime("%H:%M:%S", time.localtime(now))
+    return _last_hms[1]
+
+
+def _fmt_duration(length_ms: int) -> str:
+    # Integer division throughout; no float round-trip
+    minutes, seconds = divmod(length_ms // 1000, 60)
+    return f"{minutes}:{seconds:02d}"
+
+
+def _build_np_embed(track: wavelink.Playable, requested_by: str) -> discord.Embed:
+    # Single builder shared by /play and update_now_playing_message so the
+    # two embeds can't drift apart.
+    embed = discord.Embed(title=NP_TITLE, color=NP_COLOR)
+    embed.add_field(name="Song", value=f"**{track.title}**", inline=False)
+    embed.add_field(name=NP_DURATION_NAME, value=_fmt_duration(track.length), inline=False)
+    author = track.author or "Unknown Artist"
+    embed.add_field(name="Artist", value=author, inline=False)
+    embed.add_field(name=NP_REQUESTED_BY_NAME, value=requested_by, inline=False)
+    embed.add_field(name=NP_REQUESTED_AT_NAME, value=_now_hms(), inline=False)
+    # Only set a thumbnail when there is one; a None URL still runs through
+    # validation and adds a spurious key to the payload
+    if track.artwork:
+        embed.set_thumbnail(url=track.artwork)
+    embed.set_footer(text=f"{_bot_name_cache['name'] or 'Bot'} | Enjoy your time!")
+    return embed
+
+
+# Above this size, shuffling is worth pushing off the event loop; below it
+# the thread hop costs more than the work itself.
+OFFLOAD_THRESHOLD = 64
+
+
+def _format_queue(tracks, current) -> str:
+    # Only the top 10 entries are shown, so only those get formatted --
+    # no string building for the tail of a 200-song playlist
+    rendered = []
+    if current:
+        rendered.append(f"**Now Playing:** **{current.title}** by {current.author}")
+    rendered.extend(f"**{item.title}** by {item.author}" for item in tracks[:10 - len(rendered)])
+
+    queue_display = "\n".join(f"{i+1}. {song}" for i, song in enumerate(rendered))
+    total = len(tracks) + (1 if current else 0)
+    if total > len(rendered):
+        queue_display += f"\n...and {total - len(rendered)} more."
+    return queue_display
+
+
 # Custom wavelink Player to manage queue and history
 class CustomPlayer(wavelink.Player):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._custom_queue = asyncio.Queue()  # Our custom queue for advanced management
-        self.history = []
+        self._custom_queue = collections.deque()  # Our custom queue for advanced management
+        self.history = collections.deque(maxlen=10)  # Bounded history, oldest evicted automatically
         self.loop_mode = 0  # 0: Off, 1: Song, 2: Queue
         self.current_message = None # To update the now playing embed
+        self.current_requester = None # Mention of whoever ran /play last
+        self._last_embed_hash = None # Skip edits when the embed didn't change
+        self._from_history = False # True while replaying a track popped from history
+        self._pending_volume = None # Debounced volume target awaiting one set_volume RPC
+        self._volume_task = None
+        self._transition_lock = asyncio.Lock() # Serializes track transitions
 
-    async def add_to_custom_queue(self, track: wavelink.Playable):
-        await self._custom_queue.put(track)
+    def add_to_custom_queue(self, track: wavelink.Playable):
+        self._custom_queue.append(track)
 
     async def play_next_track_from_custom_queue(self):
         # This function is now specifically for playing the "next" song
         # from our custom queue, after the current one ends or is skipped.
-
-        if self.loop_mode == 1 and self.current: # Loop current song
-            await self.play(self.current) # Replay the current track
-            await self.update_now_playing_message()
-            return
-
-        if self._custom_queue.empty():
-            if self.loop_mode == 2 and self.history: # Loop queue
-                # Add history back to custom queue
-                for track in self.history:
-                    await self._custom_queue.put(track)
-                self.history.clear()
-            else:
-                # No more tracks in custom queue or history, disconnect
-                await self.disconnect_and_clean_up()
+        # The lock keeps concurrent triggers (track-end event plus a manual
+        # skip landing at the same time) from both popping the queue and
+        # double-playing.
+        async with self._transition_lock:
+            if self.loop_mode == 1 and self.current: # Loop current song
+                await self.play(self.current) # Replay the current track
+                await self.update_now_playing_message()
                 return
 
-        next_track = await self._custom_queue.get()
-        # Add the *just finished* track to history
-        if self.current: # self.current would be the track that just finished or was stopped
-            self.history.append(self.current)
-            if len(self.history) > 10: # Keep history manageable
-                self.history.pop(0)
-
-        await self.play(next_track) # Play the next track using wavelink's play
-        await self.update_now_playing_message()
+            if not self._custom_queue:
+                if self.loop_mode == 2 and self.history: # Loop queue
+                    # Add history back to custom queue
+                    self._custom_queue.extend(self.history)
+                    self.history.clear()
+                else:
+                    # No more tracks in custom queue or history, disconnect
+                    await self.disconnect_and_clean_up()
+                    return
+
+            next_track = self._custom_queue.popleft()
+            # Add the *just finished* track to history, unless it was itself a
+            # replay popped from history -- re-logging it would make repeated
+            # "Previous" presses cycle the same two songs.
+            if self.current and not self._from_history: # self.current would be the track that just finished or was stopped
+                self.history.append(self.current)
+            self._from_history = False
+
+            await self.play(next_track) # Play the next track using wavelink's play
+            await self.update_now_playing_message()
 
 
     async def update_now_playing_message(self):
@@ -79,32 +180,49 @@ class CustomPlayer(wavelink.Player):
         if not self.current_message or not current_track:
             return
 
-        embed = discord.Embed(
-            title="<a:musicaaa:1374994485066469386> Now Playing",
-            color=discord.Color.blue()
-        )
-        embed.add_field(name="Song", value=f"**{current_track.title}**", inline=False)
-        duration_seconds = current_track.length / 1000
-        minutes = int(duration_seconds // 60)
-        seconds = int(duration_seconds % 60)
-        embed.add_field(name="<a:durdation:1374998011020840980> Duration", value=f"{minutes}:{seconds:02d}", inline=False)
-        embed.add_field(name="Artist", value=current_track.author if current_track.author else "Unknown Artist", inline=False)
-        embed.add_field(name="<:dsdmember:1374997619935281283> Requested by", value="Bot (Queue)", inline=False) # Placeholder
-        embed.add_field(name="<a:welcomeada:1374997616844341359> Requested at", value=datetime.datetime.now().strftime("%H:%M:%S"), inline=False)
-        embed.set_thumbnail(url=current_track.artwork)
-        embed.set_footer(text=f"{bot.user.name} | Enjoy your time!")
+        embed = _build_np_embed(current_track, self.current_requester or "Bot (Queue)")
+
+        # Don't burn a Discord round-trip (and rate-limit budget) when the
+        # rendered embed is identical to what's already displayed, e.g. on
+        # loop-song replays.
+        embed_hash = hash(json.dumps(embed.to_dict(), sort_keys=True))
+        if embed_hash == self._last_embed_hash:
+            return
+        self._last_embed_hash = embed_hash
 
         try:
-            await self.current_message.edit(embed=embed, view=MusicControls())
+            await self.current_message.edit(embed=embed, view=MUSIC_CONTROLS)
         except discord.NotFound:
             self.current_message = None
         except Exception as e:
             print(f"Error updating now playing message: {e}")
 
+    def request_volume(self, volume: int):
+        # Coalesce rapid Vol +/- clicks: remember the target and make sure a
+        # single apply task is scheduled, instead of one Lavalink RPC per click
+        self._pending_volume = volume
+        if self._volume_task is None or self._volume_task.done():
+            self._volume_task = asyncio.create_task(self._apply_volume_soon())
+
+    async def _apply_volume_soon(self):
+        # Loop until no new target arrived while the RPC was in flight, so a
+        # click landing mid-apply isn't silently dropped
+        while self._pending_volume is not None:
+            await asyncio.sleep(0.25)
+            pending = self._pending_volume
+            self._pending_volume = None
+            await self.set_volume(pending)
+
     async def disconnect_and_clean_up(self):
-        self._custom_queue = asyncio.Queue()
-        self.history = []
+        self._custom_queue = collections.deque()
+        self.history.clear()
         self.loop_mode = 0
+        self._last_embed_hash = None
+        # Stop any pending volume apply; it must not fire on a disconnected player
+        if self._volume_task is not None:
+            self._volume_task.cancel()
+            self._volume_task = None
+        self._pending_volume = None
         if self.current_message:
             try:
                 await self.current_message.edit(embed=None, view=None, content="Queue finished. Disconnected from voice.")
@@ -117,6 +235,7 @@ class CustomPlayer(wavelink.Player):
 @bot.event
 async def on_ready():
     print(f"Logged in as {bot.user} (ID: {bot.user.id})")
+    _bot_name_cache["name"] = bot.user.name
 
     node = wavelink.Node(uri=f"http://{LAVALINK_HOST}:{LAVALINK_PORT}", password=LAVALINK_PASSWORD)
     await wavelink.Pool.connect(client=bot, nodes=[node])
@@ -143,7 +262,7 @@ async def on_wavelink_track_end(payload: wavelink.TrackEndEventPayload):
         await player.play_next_track_from_custom_queue()
     elif payload.reason == 1: # STOPPED
         # Track was stopped (e.g., by skip or stop command), immediately attempt to play next
-        if not player._custom_queue.empty():
+        if len(player._custom_queue) > 0:
             await player.play_next_track_from_custom_queue()
         else:
             await player.disconnect_and_clean_up()
@@ -160,6 +279,19 @@ async def join(interaction: discord.Interaction):
     await interaction.response.send_message(f"Joined {channel.mention}")
 
 
+async def _require_vc(interaction: discord.Interaction):
+    # One lookup and None-check shared by the control buttons instead of
+    # repeating the attribute walk and error reply in every handler
+    vc: CustomPlayer = interaction.guild.voice_client
+    if not vc:
+        if interaction.response.is_done():
+            await interaction.followup.send("I'm not in a voice channel.")
+        else:
+            await interaction.response.send_message("I'm not in a voice channel.", ephemeral=True)
+        return None
+    return vc
+
+
 class MusicControls(discord.ui.View):
     def __init__(self):
         super().__init__(timeout=None)
@@ -167,21 +299,17 @@ class MusicControls(discord.ui.View):
     @discord.ui.button(label="Previous", style=discord.ButtonStyle.secondary, emoji="<:11previous:1375009213893447761>")
     async def previous_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         await interaction.response.defer(ephemeral=True)
-        vc: CustomPlayer = interaction.guild.voice_client
-        if not vc:
-            await interaction.followup.send("I'm not in a voice channel.")
+        vc = await _require_vc(interaction)
+        if vc is None:
             return
 
         if vc.history:
             previous_track = vc.history.pop()
             if vc.current:
                 # Put the current track back to the *front* of the custom queue
-                temp_queue = asyncio.Queue()
-                await temp_queue.put(vc.current)
-                while not vc._custom_queue.empty():
-                    await temp_queue.put(await vc._custom_queue.get())
-                vc._custom_queue = temp_queue
+                vc._custom_queue.appendleft(vc.current)
 
+            vc._from_history = True
             await vc.play(previous_track)
             await interaction.followup.send(f"Playing previous song: **{previous_track.title}**")
             await vc.update_now_playing_message()
@@ -190,33 +318,30 @@ class MusicControls(discord.ui.View):
 
     @discord.ui.button(label="Play", style=discord.ButtonStyle.green, emoji="<:1playbutton:1375012787595776010>")
     async def play_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await interaction.response.defer(ephemeral=True)
         vc: CustomPlayer = interaction.guild.voice_client
         if vc and vc.paused:
             await vc.pause(False) # Explicitly set to resume
-            await interaction.followup.send("Resumed music!")
+            await interaction.response.send_message("Resumed music!", ephemeral=True)
         else:
-            await interaction.followup.send("Music is already playing or no music to resume.")
+            await interaction.response.send_message("Music is already playing or no music to resume.", ephemeral=True)
 
     @discord.ui.button(label="Pause", style=discord.ButtonStyle.secondary, emoji="<:111pause:1375012784839987254>")
     async def pause_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await interaction.response.defer(ephemeral=True)
         vc: CustomPlayer = interaction.guild.voice_client
         if vc and vc.playing:
             await vc.pause(True) # Explicitly set to pause
-            await interaction.followup.send("Paused music!")
+            await interaction.response.send_message("Paused music!", ephemeral=True)
         else:
-            await interaction.followup.send("No music playing to pause.")
+            await interaction.response.send_message("No music playing to pause.", ephemeral=True)
 
     @discord.ui.button(label="Skip", style=discord.ButtonStyle.secondary, emoji="<:1skipbutton:1375012780641488936>")
     async def skip_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         await interaction.response.defer(ephemeral=True)
-        vc: CustomPlayer = interaction.guild.voice_client
-        if not vc:
-            await interaction.followup.send("I'm not in a voice channel.")
+        vc = await _require_vc(interaction)
+        if vc is None:
             return
 
-        if not vc.current and vc._custom_queue.empty() and not vc.loop_mode == 2:
+        if not vc.current and not vc._custom_queue and not vc.loop_mode == 2:
             await interaction.followup.send("No more songs in the queue to skip to.")
             return
 
@@ -229,108 +354,86 @@ class MusicControls(discord.ui.View):
     @discord.ui.button(label="Stop", style=discord.ButtonStyle.danger, emoji="<:1stop:1375012777642430544>")
     async def stop_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         await interaction.response.defer(ephemeral=True)
-        vc: CustomPlayer = interaction.guild.voice_client
-        if vc:
-            await vc.disconnect_and_clean_up()
-            await interaction.followup.send("Disconnected from voice and cleared queue.")
-        else:
-            await interaction.followup.send("I'm not in a voice channel.")
+        vc = await _require_vc(interaction)
+        if vc is None:
+            return
+
+        await vc.disconnect_and_clean_up()
+        await interaction.followup.send("Disconnected from voice and cleared queue.")
 
     @discord.ui.button(label="Queue", style=discord.ButtonStyle.secondary, emoji="<:1queue:1375009211255357480>", row=1)
     async def queue_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await interaction.response.defer(ephemeral=True)
         vc: CustomPlayer = interaction.guild.voice_client
-        if not vc or (vc.current is None and vc._custom_queue.empty()): # Check for current and custom queue
-            await interaction.followup.send("The queue is empty.")
-            return
-
-        queue_list = []
-        if vc.current:
-            queue_list.append(f"**Now Playing:** **{vc.current.title}** by {vc.current.author}")
-
-        # Temporarily get items from queue to display, then put them back
-        temp_queue_items = []
-        while not vc._custom_queue.empty():
-            item = await vc._custom_queue.get()
-            queue_list.append(f"**{item.title}** by {item.author}")
-            temp_queue_items.append(item)
-
-        # Put items back into the queue
-        for item in temp_queue_items:
-            await vc._custom_queue.put(item)
-
-        if not queue_list: # Should not happen if current or custom_queue was not empty
-            await interaction.followup.send("The queue is empty.")
+        if not vc or (vc.current is None and not vc._custom_queue): # Check for current and custom queue
+            await interaction.response.send_message("The queue is empty.", ephemeral=True)
             return
 
-        queue_display = "\n".join([f"{i+1}. {song}" for i, song in enumerate(queue_list[:10])]) # Show top 10
-        if len(queue_list) > 10:
-            queue_display += f"\n...and {len(queue_list) - 10} more."
+        # Snapshot the deque so rendering never races a track transition.
+        # Formatting is O(10) now that only the visible entries are rendered,
+        # so it's never worth a thread hop.
+        queue_display = _format_queue(list(vc._custom_queue), vc.current)
 
         embed = discord.Embed(title="Music Queue", description=queue_display, color=discord.Color.purple())
-        await interaction.followup.send(embed=embed)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
 
 
     @discord.ui.button(label="Shuffle", style=discord.ButtonStyle.secondary, emoji="<:1autoplay:1375009203508215839>", row=1)
     async def shuffle_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await interaction.response.defer(ephemeral=True)
-        vc: CustomPlayer = interaction.guild.voice_client
-        if not vc:
-            await interaction.followup.send("I'm not in a voice channel.")
+        vc = await _require_vc(interaction)
+        if vc is None:
             return
 
-        if vc._custom_queue.empty():
-            await interaction.followup.send("Queue is empty, nothing to shuffle.")
+        if not vc._custom_queue:
+            await interaction.response.send_message("Queue is empty, nothing to shuffle.", ephemeral=True)
             return
 
-        queue_items = []
-        while not vc._custom_queue.empty():
-            queue_items.append(await vc._custom_queue.get())
-
-        random.shuffle(queue_items)
-
-        for item in queue_items:
-            await vc._custom_queue.put(item)
+        queue_items = list(vc._custom_queue)
+        if len(queue_items) > OFFLOAD_THRESHOLD:
+            await asyncio.to_thread(random.shuffle, queue_items)
+        else:
+            random.shuffle(queue_items)
+        vc._custom_queue = collections.deque(queue_items)
 
-        await interaction.followup.send("Queue shuffled!")
+        await interaction.response.send_message("Queue shuffled!", ephemeral=True)
 
     @discord.ui.button(label="Loop", style=discord.ButtonStyle.secondary, emoji="<:1refresh:1375012783116128276>", row=1)
     async def loop_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await interaction.response.defer(ephemeral=True)
-        vc: CustomPlayer = interaction.guild.voice_client
-        if not vc:
-            await interaction.followup.send("I'm not in a voice channel.")
+        vc = await _require_vc(interaction)
+        if vc is None:
             return
 
         vc.loop_mode = (vc.loop_mode + 1) % 3 # Cycle through 0, 1, 2
         modes = {0: "Off", 1: "Song", 2: "Queue"}
-        await interaction.followup.send(f"Loop mode set to: **{modes[vc.loop_mode]}**")
+        await interaction.response.send_message(f"Loop mode set to: **{modes[vc.loop_mode]}**", ephemeral=True)
 
     @discord.ui.button(label="Vol +", style=discord.ButtonStyle.secondary, emoji="<:1mediumvolume:1375014100257603634>", row=1)
     async def vol_up_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await interaction.response.defer(ephemeral=True)
-        vc: CustomPlayer = interaction.guild.voice_client
-        if not vc:
-            await interaction.followup.send("I'm not in a voice channel.")
+        vc = await _require_vc(interaction)
+        if vc is None:
             return
 
-        current_volume = vc.volume # Volume is 0-1000
+        # Base on the pending target so rapid clicks stack correctly
+        current_volume = vc._pending_volume if vc._pending_volume is not None else vc.volume # Volume is 0-1000
         new_volume = min(1000, current_volume + 100) # Increase by 100, max 1000
-        await vc.set_volume(new_volume)
-        await interaction.followup.send(f"Volume set to {new_volume // 10}%")
+        vc.request_volume(new_volume)
+        await interaction.response.send_message(f"Volume set to {new_volume // 10}%", ephemeral=True)
 
     @discord.ui.button(label="Vol -", style=discord.ButtonStyle.secondary, emoji="<:1lowvolume:1375014097611001896>", row=1)
     async def vol_down_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await interaction.response.defer(ephemeral=True)
-        vc: CustomPlayer = interaction.guild.voice_client
-        if not vc:
-            await interaction.followup.send("I'm not in a voice channel.")
+        vc = await _require_vc(interaction)
+        if vc is None:
             return
 
-        current_volume = vc.volume
+        current_volume = vc._pending_volume if vc._pending_volume is not None else vc.volume
         new_volume = max(0, current_volume - 100) # Decrease by 100, min 0
-        await vc.set_volume(new_volume)
-        await interaction.followup.send(f"Volume set to {new_volume // 10}%")
+        vc.request_volume(new_volume)
+        await interaction.response.send_message(f"Volume set to {new_volume // 10}%", ephemeral=True)
+
+
+# The view is stateless (timeout=None, no per-instance data), so one shared
+# instance serves every now-playing message instead of allocating 9 buttons
+# per edit.
+MUSIC_CONTROLS = MusicControls()
 
 
 @bot.tree.command(name="play", description="Plays a song from YouTube.")
@@ -344,7 +447,7 @@ async def play(interaction: discord.Interaction, query: str):
             return
         vc = await interaction.user.voice.channel.connect(cls=CustomPlayer)
 
-    tracks = await wavelink.Playable.search(query)
+    tracks = await cached_search(query)
     if not tracks:
         await interaction.followup.send(f"No tracks found for '{query}'")
         return
@@ -352,38 +455,20 @@ async def play(interaction: discord.Interaction, query: str):
     track = tracks[0]
 
     # THIS IS THE CRUCIAL LOGIC FOR QUEUEING SONGS
+    vc.current_requester = interaction.user.mention
+
     if vc.playing:
         # If something is already playing, add to our custom queue
-        await vc.add_to_custom_queue(track)
+        vc.add_to_custom_queue(track)
         await interaction.followup.send(f"Added **{track.title}** to the queue.")
     else:
         # If nothing is playing, play this track directly
         await vc.play(track)
-        
-        embed = discord.Embed(
-            title="<a:musicaaa:1374994485066469386> Now Playing",
-            color=discord.Color.blue()
-        )
-        embed.add_field(name="Song", value=f"**{track.title}**", inline=False)
-        duration_seconds = track.length / 1000
-        minutes = int(duration_seconds // 60)
-        seconds = int(duration_seconds % 60)
-        embed.add_field(name="<a:durdation:1374998011020840980> Duration", value=f"{minutes}:{seconds:02d}", inline=False)
-        embed.add_field(name="Artist", value=track.author if track.author else "Unknown Artist", inline=False)
-        embed.add_field(name="<:dsdmember:1374997619935281283> Requested by", value=interaction.user.mention, inline=False)
-        embed.add_field(name="<a:welcomeada:1374997616844341359> Requested at", value=datetime.datetime.now().strftime("%H:%M:%S"), inline=False)
-        embed.set_thumbnail(url=track.artwork)
-        embed.set_footer(text=f"{bot.user.name} | Enjoy your time!")
 
-        msg = await interaction.followup.send(embed=embed, view=MusicControls())
+        embed = _build_np_embed(track, interaction.user.mention)
+        msg = await interaction.followup.send(embed=embed, view=MUSIC_CONTROLS)
         vc.current_message = msg # Store the message to update later
 
-        # After playing the first track, if there are more tracks in our custom queue,
-        # we can initiate playback of the next one here. This is crucial for seamless transitions.
-        if not vc._custom_queue.empty():
-            # Schedule the next track to play without blocking the current command response
-            bot.loop.create_task(vc.play_next_track_from_custom_queue())
-
 
 # The /stop slash command has been removed as per your request.
 # The 'Stop' button in MusicControls still handles disconnecting and clearing the queue.